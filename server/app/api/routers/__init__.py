@@ -1,13 +1,8 @@
-from app.api.routers.chat import router as chat_router
-from app.api.routers.health import router as health_router
-from app.api.routers.oracle import router as oracle_router
-from app.api.routers.redis import router as redis_router
-from app.api.routers.stream import router as stream_router
-
+# Router modules are imported lazily by app.api.routes.include_routers
 __all__ = [
-    "health_router",
-    "stream_router",
-    "redis_router",
-    "chat_router",
-    "oracle_router",
+    "health",
+    "stream",
+    "redis",
+    "chat",
+    "oracle",
 ]
@@ -1,6 +1,8 @@
+import asyncio
 import logging
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 
 from app.db.connection import oracle_db, redis_db
 from app.schemas.api import HealthResponse, RootResponse
@@ -8,21 +10,42 @@ from app.schemas.api import HealthResponse, RootResponse
 router = APIRouter(tags=["Health"])
 logger = logging.getLogger(__name__)
 
+REDIS_PING_TIMEOUT = 1.0
 
-@router.get("/", response_model=RootResponse)
-async def root() -> RootResponse:
-    """
-    Root endpoint providing API information.
 
-    Returns:
-        RootResponse with API metadata and available endpoints
-    """
-    logger.debug("Root endpoint accessed")
+async def _redis_healthy() -> bool:
+    """Ping Redis with a short timeout."""
+    if redis_db.client is None:
+        return False
+    try:
+        return bool(await asyncio.wait_for(redis_db.client.ping(), timeout=REDIS_PING_TIMEOUT))
+    except Exception:
+        return False
+
+
+async def _oracle_ping() -> None:
+    async with oracle_db.AsyncReadEngine.connect() as conn:
+        await conn.exec_driver_sql("SELECT 1 FROM dual")
+
+
+async def _oracle_healthy() -> bool:
+    """Run ``SELECT 1 FROM dual`` on the async read pool with the Redis ping timeout."""
+    if oracle_db.AsyncReadEngine is None:
+        return False
+    try:
+        await asyncio.wait_for(_oracle_ping(), timeout=REDIS_PING_TIMEOUT)
+        return True
+    except Exception:
+        return False
+
 
-    return RootResponse(
-        message="SSE Streaming Server",
-        version="0.1.0",
-        endpoints={
+# /health is hit by liveness probes: build JSON bytes directly instead of a
+# response_model validate + serialize round trip. The schemas stay in OpenAPI.
+_ROOT_BODY = orjson.dumps(
+    {
+        "message": "SSE Streaming Server",
+        "version": "0.1.0",
+        "endpoints": {
             "stream": "/stream/{type}",
             "stream_db": "/stream/database",
             "stream_redis": "/stream/redis/{channel}",
@@ -30,28 +53,49 @@ async def root() -> RootResponse:
             "oracle_orders": "/stream/oracle/orders/changes",
             "chat": "/chat/stream",
         },
-    )
+    }
+)
+
+
+@router.get("/", response_class=Response, responses={200: {"model": RootResponse}})
+async def root() -> Response:
+    """
+    Root endpoint providing API information.
+
+    Returns:
+        Pre-encoded RootResponse JSON with API metadata and available endpoints
+    """
+    logger.debug("Root endpoint accessed")
+
+    return Response(_ROOT_BODY, media_type="application/json")
 
 
-@router.get("/health", response_model=HealthResponse)
-async def health() -> HealthResponse:
+@router.get("/health", response_class=Response, responses={200: {"model": HealthResponse}})
+async def health() -> Response:
     """
     Health check endpoint.
 
     Returns:
-        HealthResponse with service status and database connectivity
+        HealthResponse JSON with service status and database connectivity
     """
-    oracle_healthy = oracle_db.connection is not None
-    redis_healthy = redis_db.client is not None
+    oracle_healthy, redis_healthy = await asyncio.gather(_oracle_healthy(), _redis_healthy())
 
     overall_status = "healthy" if (oracle_healthy or redis_healthy) else "degraded"
 
-    logger.info(
-        f"Health check: {overall_status} (Oracle: {oracle_healthy}, Redis: {redis_healthy})"
+    logger.debug(
+        "Health check: %s (Oracle: %s, Redis: %s)",
+        overall_status,
+        oracle_healthy,
+        redis_healthy,
     )
 
-    return HealthResponse(
-        status=overall_status,
-        oracle=oracle_healthy,
-        redis=redis_healthy,
+    return Response(
+        orjson.dumps(
+            {
+                "status": overall_status,
+                "oracle": oracle_healthy,
+                "redis": redis_healthy,
+            }
+        ),
+        media_type="application/json",
     )
@@ -1,8 +1,8 @@
+import asyncio
 import logging
-from datetime import datetime
 
 from fastapi import APIRouter, Depends
-from sqlalchemy import func, select
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
 
 from app.core.exceptions import RecordNotFoundError, handle_db_error
@@ -20,20 +20,25 @@ logger = logging.getLogger(__name__)
 
 
 @router.post("/orders", response_model=CreateOrderResponse)
-def create_order(
+async def create_order(
     req: CreateOrderRequest,
     db: Session = Depends(get_db),
 ) -> CreateOrderResponse:
     """
     Create a new order in ORDERS for testing SSE change stream.
 
-    Uses ORM for type-safe data insertion.
+    Uses a Core INSERT ... RETURNING: the ID comes from ``orders_seq`` and the
+    generated ID/date are returned in the same round trip, without a
+    MAX(order_id) pre-query or ORM unit-of-work overhead.
 
     Uses FastAPI Dependency Injection for automatic session management:
     - Auto-commit on success
     - Auto-rollback on error
     - Auto-cleanup
 
+    Blocking session calls run in a worker thread so the event loop keeps
+    serving SSE streams during the DB round-trips.
+
     Args:
         req: Order creation request
         db: Database session (injected)
@@ -44,41 +49,41 @@ def create_order(
     Raises:
         HTTPException: On database errors
     """
-    try:
-        # Get next ID using ORM query builder
-        max_id_stmt = select(func.coalesce(func.max(Order.order_id), 0))
-        max_id = db.scalar(max_id_stmt)
-        next_id = int(max_id) + 1
-
-        # Create new order using ORM
-        new_order = Order(
-            order_id=next_id,
-            customer_id=req.customer_id,
-            status=req.status,
-            salesman_id=req.salesman_id,
-            order_date=datetime.now(),
-        )
 
-        db.add(new_order)
-        db.flush()  # Flush to get any DB-generated values
+    def _do() -> CreateOrderResponse:
+        # order_id is filled from orders_seq.NEXTVAL
+        stmt = (
+            insert(Order)
+            .values(
+                customer_id=req.customer_id,
+                status=req.status,
+                salesman_id=req.salesman_id,
+                order_date=func.sysdate(),
+            )
+            .returning(Order.order_id, Order.order_date)
+        )
+        order_id, order_date = db.execute(stmt).one()
 
-        logger.info(f"Created order {new_order.order_id} for customer {new_order.customer_id}")
+        logger.info(f"Created order {order_id} for customer {req.customer_id}")
 
         return CreateOrderResponse(
             ok=True,
-            order_id=new_order.order_id,
-            customer_id=new_order.customer_id,
-            status=new_order.status,
-            salesman_id=new_order.salesman_id,
-            order_date=new_order.order_date.isoformat(),
+            order_id=order_id,
+            customer_id=req.customer_id,
+            status=req.status,
+            salesman_id=req.salesman_id,
+            order_date=order_date.isoformat(),
         )
+
+    try:
+        return await asyncio.to_thread(_do)
     except Exception as e:
         logger.error(f"Failed to create order: {e}", exc_info=True)
         raise handle_db_error(e) from e
 
 
 @router.patch("/orders/{order_id}/status", response_model=UpdateOrderStatusResponse)
-def update_order_status(
+async def update_order_status(
     order_id: int,
     req: UpdateOrderStatusRequest,
     db: Session = Depends(get_db),
@@ -86,10 +91,13 @@ def update_order_status(
     """
     Update ORDERS.STATUS for testing SSE change stream.
 
-    Uses ORM for type-safe query and update.
+    Uses ``Session.get`` for the primary-key lookup and lets the unit of work
+    emit the UPDATE on flush.
 
     Uses FastAPI Dependency Injection for automatic session management.
 
+    Blocking session calls run in a worker thread (see create_order).
+
     Args:
         order_id: ID of the order to update
         req: Status update request
@@ -101,10 +109,10 @@ def update_order_status(
     Raises:
         HTTPException: If order not found or database error occurs
     """
-    try:
-        # Query order using ORM
-        stmt = select(Order).where(Order.order_id == order_id)
-        order = db.scalar(stmt)
+
+    def _do() -> UpdateOrderStatusResponse:
+        # Primary-key lookup: identity map first, then SELECT ... WHERE order_id = :pk
+        order = db.get(Order, order_id)
 
         if not order:
             logger.warning(f"Order {order_id} not found for status update")
@@ -127,6 +135,9 @@ def update_order_status(
             old_status=old_status,
             new_status=req.status,
         )
+
+    try:
+        return await asyncio.to_thread(_do)
     except RecordNotFoundError:
         raise
     except Exception as e:
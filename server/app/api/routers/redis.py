@@ -1,6 +1,6 @@
-import json
 import logging
 
+import orjson
 from fastapi import APIRouter, HTTPException
 
 from app.db.connection import redis_db
@@ -32,17 +32,17 @@ async def publish_to_redis(
         HTTPException: If Redis client is not available or publish fails
     """
     try:
-        redis_client = redis_db.get_client()
+        redis_client = await redis_db.get_client()
         if redis_client is None:
             logger.error("Redis client is not connected")
             raise HTTPException(
                 status_code=503, detail="Redis service is not available"
             )
 
-        # Publish message to Redis
-        redis_client.publish(channel, json.dumps(request.message))
+        # orjson emits bytes, which redis-py sends as-is (no str -> bytes encode)
+        await redis_client.publish(channel, orjson.dumps(request.message))
 
-        logger.info(f"Published message to Redis channel: {channel}")
+        logger.debug("Published message to Redis channel: %s", channel)
 
         return PublishMessageResponse(
             status="published", channel=channel, message=request.message
@@ -1,14 +1,11 @@
 import logging
+from collections.abc import AsyncIterator
 
-from fastapi import APIRouter, Depends, Query
-from sse_starlette.sse import EventSourceResponse
+from fastapi import APIRouter, Depends
 
+from app.core.sse import EventSourceResponse, ServerSentEvent, sse_endpoint
 from app.db.streaming_helpers import get_session_factory
-from app.schemas.api import (
-    DatabaseStreamRequest,
-    OracleOrdersStreamRequest,
-    OracleTelemetryStreamRequest,
-)
+from app.schemas.api import OracleOrdersStreamRequest
 from app.services.generic_streaming import stream_data_generator
 from app.services.oracle_streaming import (
     stream_database_data,
@@ -21,41 +18,48 @@ router = APIRouter(prefix="/stream", tags=["Stream"])
 logger = logging.getLogger(__name__)
 
 
-@router.post("/database")
+@router.post("/database", response_class=EventSourceResponse)
+@sse_endpoint
 async def stream_database(
-    request: DatabaseStreamRequest,
     session_factory=Depends(get_session_factory),
-) -> EventSourceResponse:
+) -> AsyncIterator[ServerSentEvent]:
     """
     Stream data from Oracle database.
 
-    Returns:
-        EventSourceResponse with database time and count
+    Takes no parameters; any POST body sent by clients is ignored.
+
+    Yields:
+        ServerSentEvent with database time and count
     """
-    logger.info("Starting database stream")
-    return EventSourceResponse(stream_database_data(session_factory))
+    logger.debug("Starting database stream")
+    async for event in stream_database_data(session_factory):
+        yield event
 
 
-@router.post("/oracle/telemetry")
+@router.post("/oracle/telemetry", response_class=EventSourceResponse)
+@sse_endpoint
 async def stream_oracle_telemetry(
-    request: OracleTelemetryStreamRequest,
     session_factory=Depends(get_session_factory),
-) -> EventSourceResponse:
+) -> AsyncIterator[ServerSentEvent]:
     """
     Stream telemetry from Oracle (db_time, object_count, query_ms).
 
-    Returns:
-        EventSourceResponse with Oracle telemetry data
+    Takes no parameters; any POST body sent by clients is ignored.
+
+    Yields:
+        ServerSentEvent with Oracle telemetry data
     """
-    logger.info("Starting Oracle telemetry stream")
-    return EventSourceResponse(stream_oracle_telemetry_data(session_factory))
+    logger.debug("Starting Oracle telemetry stream")
+    async for event in stream_oracle_telemetry_data(session_factory):
+        yield event
 
 
-@router.post("/oracle/orders/changes")
+@router.post("/oracle/orders/changes", response_class=EventSourceResponse)
+@sse_endpoint
 async def stream_oracle_orders_changes(
     request: OracleOrdersStreamRequest,
     session_factory=Depends(get_session_factory),
-) -> EventSourceResponse:
+) -> AsyncIterator[ServerSentEvent]:
     """
     Stream change events from ORDERS (new rows + status changes).
 
@@ -63,46 +67,51 @@ async def stream_oracle_orders_changes(
         request: Stream configuration (limit, poll_interval)
         session_factory: Database session factory
 
-    Returns:
-        EventSourceResponse with order change events
+    Yields:
+        ServerSentEvent with order change events
     """
-    logger.info(
-        f"Starting Oracle orders stream (limit={request.limit}, interval={request.poll_interval})"
-    )
-    return EventSourceResponse(
-        stream_oracle_orders_changes_data(
-            session_factory=session_factory,
-            limit=request.limit,
-            poll_interval=request.poll_interval,
-        )
+    logger.debug(
+        "Starting Oracle orders stream (limit=%s, interval=%s)",
+        request.limit,
+        request.poll_interval,
     )
+    async for event in stream_oracle_orders_changes_data(
+        session_factory=session_factory,
+        limit=request.limit,
+        poll_interval=request.poll_interval,
+    ):
+        yield event
 
 
-@router.get("/redis/{channel}")
-async def stream_redis(channel: str) -> EventSourceResponse:
+@router.get("/redis/{channel}", response_class=EventSourceResponse)
+@sse_endpoint
+async def stream_redis(channel: str) -> AsyncIterator[ServerSentEvent]:
     """
     Stream data from Redis pub/sub.
 
     Args:
         channel: Redis channel to subscribe to
 
-    Returns:
-        EventSourceResponse with Redis pub/sub messages
+    Yields:
+        ServerSentEvent with Redis pub/sub messages
     """
-    logger.info(f"Starting Redis stream for channel: {channel}")
-    return EventSourceResponse(stream_redis_data(channel))
+    logger.debug("Starting Redis stream for channel: %s", channel)
+    async for event in stream_redis_data(channel):
+        yield event
 
 
-@router.get("/{stream_type}")
-async def stream_endpoint(stream_type: str) -> EventSourceResponse:
+@router.get("/{stream_type}", response_class=EventSourceResponse)
+@sse_endpoint
+async def stream_endpoint(stream_type: str) -> AsyncIterator[ServerSentEvent]:
     """
     SSE streaming endpoint for generic data streams.
 
     Args:
         stream_type: Type of stream (counter, timestamp, custom)
 
-    Returns:
-        EventSourceResponse with stream data
+    Yields:
+        ServerSentEvent with stream data
     """
-    logger.info(f"Starting generic stream: {stream_type}")
-    return EventSourceResponse(stream_data_generator(stream_type))
+    logger.debug("Starting generic stream: %s", stream_type)
+    async for event in stream_data_generator(stream_type):
+        yield event
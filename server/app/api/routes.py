@@ -1,17 +1,15 @@
 from fastapi import FastAPI
-# Force reload
-
-from app.api.routers import (
-    chat_router,
-    health_router,
-    oracle_router,
-    redis_router,
-    stream_router,
-)
 
 
 def include_routers(app: FastAPI):
     """Register all application routers"""
+    # Imported here so loading app.api does not pull in openai/sqlalchemy/redis
+    from app.api.routers.chat import router as chat_router
+    from app.api.routers.health import router as health_router
+    from app.api.routers.oracle import router as oracle_router
+    from app.api.routers.redis import router as redis_router
+    from app.api.routers.stream import router as stream_router
+
     app.include_router(health_router)
     app.include_router(stream_router)
     app.include_router(redis_router)
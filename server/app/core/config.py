@@ -1,3 +1,5 @@
+from functools import cached_property, lru_cache
+
 from pydantic import Field, computed_field
 from pydantic_settings import BaseSettings
 
@@ -9,6 +11,9 @@ class Settings(BaseSettings):
     host: str = "127.0.0.1"
     port: int = 8000
     debug: bool = False
+    uvicorn_workers: int = Field(
+        default=4, ge=1, alias="UVICORN_WORKERS", description="Worker processes (forced to 1 in debug)"
+    )
 
     # Oracle
     db_username: str = Field(default="", alias="DB_USERNAME")
@@ -33,6 +38,12 @@ class Settings(BaseSettings):
     # CORS
     cors_origins: str = "http://localhost:3000"
 
+    @computed_field
+    @cached_property
+    def cors_origins_list(self) -> tuple[str, ...]:
+        """Comma-separated ``cors_origins`` parsed once per Settings instance."""
+        return tuple(o.strip() for o in self.cors_origins.split(",") if o.strip())
+
     # OpenAI
     openai_api_key: str = Field(default="", alias="OPENAI_API_KEY")
     openai_model: str = Field(default="gpt-4o-mini", alias="OPENAI_MODEL")
@@ -44,10 +55,27 @@ class Settings(BaseSettings):
     chat_paragraph_flush_threshold: int = Field(
         default=200, description="Minimum buffer size for paragraph mode"
     )
+    chat_token_batch_size: int = Field(
+        default=16, ge=1, description="Max deltas coalesced into one SSE event in token mode"
+    )
+    chat_token_batch_interval: float = Field(
+        default=0.02, ge=0, description="Max seconds a delta waits for batching in token mode"
+    )
 
     class Config:
         env_file = ".env"
         case_sensitive = False
 
 
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Return the process-wide Settings instance.
+
+    `.env` is parsed once; tests can call ``get_settings.cache_clear()``
+    (or override the dependency) to load different settings.
+    """
+    return Settings()
+
+
+settings = get_settings()
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
@@ -15,11 +16,13 @@ async def lifespan(app: FastAPI):
     logger.info("Starting up...")
     try:
         oracle_db.connect()
+        await asyncio.to_thread(oracle_db.warm_pool)
+        await oracle_db.warm_async_pool()
     except Exception as e:
         logger.warning(f"Warning: Could not connect to Oracle: {e}")
 
     try:
-        redis_db.connect()
+        await redis_db.connect()
     except Exception as e:
         logger.warning(f"Warning: Could not connect to Redis: {e}")
 
@@ -27,5 +30,5 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down...")
-    oracle_db.disconnect()
-    redis_db.disconnect()
+    await oracle_db.disconnect()
+    await redis_db.disconnect()
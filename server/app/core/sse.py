@@ -0,0 +1,137 @@
+"""
+Server-Sent Events backend selection.
+
+FastAPI >= 0.135 ships native SSE support (``fastapi.sse``): a path operation
+declared with ``response_class=EventSourceResponse`` that ``yield``s is framed
+by FastAPI itself, including keep-alive pings and proxy headers.
+Older FastAPI versions fall back to ``sse_starlette``.
+
+Usage:
+    @router.get("/events", response_class=EventSourceResponse)
+    @sse_endpoint
+    async def events() -> AsyncIterator[ServerSentEvent]:
+        async for event in stream_something():
+            yield event
+"""
+
+import functools
+import inspect
+from collections.abc import AsyncIterator, Callable
+from datetime import datetime
+
+import orjson
+
+try:
+    from fastapi.sse import EventSourceResponse, ServerSentEvent
+
+    NATIVE_SSE = True
+except ImportError:  # FastAPI < 0.135
+    from sse_starlette.sse import EventSourceResponse, ServerSentEvent
+
+    NATIVE_SSE = False
+
+# Keep proxies (nginx) from buffering or caching the stream. Native FastAPI SSE
+# sets exactly these; the sse_starlette fallback is given them explicitly.
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+# b'{"type":"<event_type>","timestamp":' per event type; only the timestamp and
+# payload vary between events of one stream
+_EVENT_PREFIXES: dict[str, bytes] = {}
+
+
+def event_timestamp() -> bytes:
+    """
+    Return the current time as an encoded JSON timestamp.
+
+    Pass it to ``encode_event_data`` to share one timestamp across every event
+    emitted in the same poll tick.
+    """
+    return orjson.dumps(datetime.now())
+
+
+def event_prefix(event_type: str) -> bytes:
+    """
+    Return the cached ``{"type":"<event_type>","timestamp":`` head of an event.
+
+    Streams with a fixed payload shape can append the timestamp and their own
+    fields to it directly instead of going through ``encode_event_data``.
+    """
+    prefix = _EVENT_PREFIXES.get(event_type)
+    if prefix is None:
+        prefix = _EVENT_PREFIXES[event_type] = b'{"type":' + orjson.dumps(event_type) + b',"timestamp":'
+    return prefix
+
+
+def encode_event_data(event_type: str, payload: dict, timestamp: bytes | None = None) -> str:
+    """
+    Encode ``{"type": event_type, "timestamp": <now>, **payload}`` as JSON.
+
+    The constant ``type`` prefix is cached per event type and the payload is
+    spliced in after it, so no merged dict is built per event. orjson formats
+    the naive local ``datetime`` itself (same ISO 8601 text as ``isoformat()``)
+    and the result is decoded to ``str`` once.
+
+    Args:
+        event_type: Value of the ``type`` field
+        payload: Remaining event fields
+        timestamp: Pre-encoded timestamp from ``event_timestamp()``; defaults to now
+
+    Returns:
+        JSON-encoded event payload
+    """
+    head = event_prefix(event_type) + (timestamp or event_timestamp())
+    if not payload:
+        return (head + b"}").decode()
+    return (head + b"," + orjson.dumps(payload)[1:]).decode()
+
+
+def sse_event(data: str, event: str = "message") -> ServerSentEvent:
+    """
+    Create an SSE event from an already JSON-encoded payload.
+
+    The payload is sent as-is in the ``data:`` field, so the response layer does
+    not re-encode it.
+
+    Args:
+        data: JSON-encoded event payload
+        event: SSE event name
+
+    Returns:
+        ServerSentEvent for the active SSE backend
+    """
+    if NATIVE_SSE:
+        # Skip model validation: event names are fixed and payloads are pre-encoded JSON
+        return ServerSentEvent.model_construct(raw_data=data, event=event)
+    return ServerSentEvent(data=data, event=event)
+
+
+def sse_endpoint(
+    func: Callable[..., AsyncIterator[ServerSentEvent]],
+) -> Callable[..., AsyncIterator[ServerSentEvent]] | Callable[..., EventSourceResponse]:
+    """
+    Adapt an async generator path operation to the active SSE backend.
+
+    With native FastAPI SSE the generator is returned unchanged. With
+    ``sse_starlette`` it is wrapped in an endpoint returning ``EventSourceResponse``.
+
+    Raises:
+        TypeError: If ``func`` is not an ``async def`` generator. Sync generators
+            are iterated in Starlette's threadpool, one dispatch per event.
+    """
+    if not inspect.isasyncgenfunction(func):
+        raise TypeError(f"SSE endpoint {func.__qualname__} must be an async generator function")
+
+    if NATIVE_SSE:
+        return func
+
+    @functools.wraps(func)
+    async def endpoint(*args, **kwargs) -> EventSourceResponse:
+        return EventSourceResponse(func(*args, **kwargs), headers=SSE_HEADERS)
+
+    # Expose the generator's parameters to FastAPI, but not the generator itself
+    endpoint.__signature__ = inspect.signature(func).replace(  # type: ignore[attr-defined]
+        return_annotation=EventSourceResponse
+    )
+    del endpoint.__wrapped__  # type: ignore[attr-defined]
+    return endpoint
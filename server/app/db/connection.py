@@ -1,7 +1,8 @@
-from collections.abc import Generator
-from contextlib import contextmanager
+from collections.abc import AsyncGenerator, Generator
+from contextlib import asynccontextmanager, contextmanager
 
 from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
@@ -14,28 +15,45 @@ class DatabaseManager:
     def __init__(self):
         self.engine = None
         self.SessionLocal = None
+        self.AsyncReadEngine = None
+        self.AsyncReadSessionLocal = None
 
     def connect(self):
         """Establish database engines and session factories"""
         try:
             # 1. Oracle Engine (using oracledb)
-            oracle_url = (
-                f"oracle+oracledb://{settings.db_username}:"
+            oracle_dsn = (
+                f"{settings.db_username}:"
                 f"{settings.db_password}@{settings.db_host}:"
                 f"{settings.db_port}/?service_name={settings.db_service_name}"
             )
+            oracle_url = f"oracle+oracledb://{oracle_dsn}"
 
-            self.engine = create_engine(
-                oracle_url,
+            engine_options = {
                 # Connection Pool Settings
-                pool_pre_ping=True,  # Verify connections before use
-                pool_size=5,  # Base pool size
-                max_overflow=10,  # Max additional connections
-                pool_recycle=3600,  # Recycle connections after 1 hour
-                pool_timeout=30,  # Wait max 30s for connection
-                echo_pool=False,  # Set to True for debugging
+                # No SELECT 1 per checkout: the pool is pre-warmed at startup
+                # and pool_recycle retires connections before they go stale
+                "pool_pre_ping": False,
+                "pool_size": 5,  # Base pool size
+                "max_overflow": 10,  # Max additional connections
+                "pool_recycle": 3600,  # Recycle connections after 1 hour
+                "pool_timeout": 30,  # Wait max 30s for connection
+                "echo_pool": False,  # Set to True for debugging
                 # Query Settings
-                echo=settings.debug,  # Log SQL queries in debug mode
+                "echo": settings.debug,  # Log SQL queries in debug mode
+            }
+
+            self.engine = create_engine(oracle_url, **engine_options)
+
+            # 2. Async read-only engine for SSE polling: queries are awaited on the
+            # event loop (python-oracledb asyncio) instead of a worker thread each.
+            # AUTOCOMMIT means no BEGIN/ROLLBACK around SELECTs, and with nothing
+            # to reset the pool skips the rollback-on-checkin
+            self.AsyncReadEngine = create_async_engine(
+                f"oracle+oracledb_async://{oracle_dsn}",
+                isolation_level="AUTOCOMMIT",
+                pool_reset_on_return=None,
+                **engine_options,
             )
 
             # Event listener: log pool checkouts (optional)
@@ -46,6 +64,9 @@ class DatabaseManager:
                     print(f"New DB connection: {id(dbapi_conn)}")
 
             self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+            self.AsyncReadSessionLocal = async_sessionmaker(
+                bind=self.AsyncReadEngine, autoflush=False, expire_on_commit=False
+            )
 
             # Note: We don't call Base.metadata.create_all() here
             # Database schema is managed by DBA, not by the application
@@ -56,11 +77,37 @@ class DatabaseManager:
             print(f"Database initialization error: {e}")
             raise
 
-    def disconnect(self):
-        """Dispose of the engine"""
+    def warm_pool(self):
+        """
+        Open ``pool_size`` connections on the engine and return them to the pool.
+
+        The TCP + TNS/auth handshake is paid at startup instead of by the first
+        requests.
+        """
+        if self.engine is None:
+            return
+        conns = [self.engine.connect() for _ in range(self.engine.pool.size())]
+        for conn in conns:
+            conn.close()
+        print("Database connection pool warmed")
+
+    async def warm_async_pool(self):
+        """Open ``pool_size`` connections on the async read engine (see warm_pool)."""
+        if self.AsyncReadEngine is None:
+            return
+        conns = [await self.AsyncReadEngine.connect() for _ in range(self.AsyncReadEngine.pool.size())]
+        for conn in conns:
+            await conn.close()
+        print("Async database connection pool warmed")
+
+    async def disconnect(self):
+        """Dispose of the engines"""
         if self.engine:
             self.engine.dispose()
             print("Database engine disposed")
+        if self.AsyncReadEngine:
+            await self.AsyncReadEngine.dispose()
+            print("Async read-only database engine disposed")
 
     def get_session(self) -> Session:
         """
@@ -98,15 +145,35 @@ class DatabaseManager:
         finally:
             session.close()
 
+    @asynccontextmanager
+    async def async_read_session_scope(self) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Provide an async read-only (AUTOCOMMIT) scope for SELECT-only operations.
+
+        No commit/rollback is issued.
+
+        Usage:
+            async with oracle_db.async_read_session_scope() as session:
+                await session.execute(...)
+        """
+        if not self.AsyncReadSessionLocal:
+            self.connect()
+
+        if self.AsyncReadSessionLocal is None:
+            raise RuntimeError("Async read-only session factory not initialized")
+
+        async with self.AsyncReadSessionLocal() as session:
+            yield session
+
 
 class RedisDB:
-    """Redis connection manager"""
+    """Redis connection manager (asyncio client)"""
 
     def __init__(self):
         self.client = None
 
-    def connect(self):
-        from redis import Redis
+    async def connect(self):
+        from redis.asyncio import Redis
 
         try:
             self.client = Redis(
@@ -116,20 +183,20 @@ class RedisDB:
                 password=(settings.redis_password if settings.redis_password else None),
                 decode_responses=True,
             )
-            self.client.ping()
+            await self.client.ping()
             print("Redis connected successfully")
         except Exception as e:
             print(f"Redis connection error: {e}")
             raise
 
-    def disconnect(self):
+    async def disconnect(self):
         if self.client:
-            self.client.close()
+            await self.client.aclose()
             print("Redis disconnected")
 
-    def get_client(self):
+    async def get_client(self):
         if not self.client:
-            self.connect()
+            await self.connect()
         return self.client
 
 
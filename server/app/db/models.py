@@ -7,7 +7,7 @@ For complex queries, raw SQL can still be used via text().
 
 from datetime import datetime
 
-from sqlalchemy import String
+from sqlalchemy import Sequence, String
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -22,11 +22,13 @@ class Order(Base):
     Order table model.
 
     Represents orders in the system for tracking and SSE streaming.
+
+    New order IDs come from the DBA-managed ``orders_seq`` sequence.
     """
 
     __tablename__ = "orders"
 
-    order_id: Mapped[int] = mapped_column(primary_key=True)
+    order_id: Mapped[int] = mapped_column(Sequence("orders_seq"), primary_key=True)
     customer_id: Mapped[int] = mapped_column(nullable=False)
     status: Mapped[str] = mapped_column(String(20), nullable=False)
     salesman_id: Mapped[int | None] = mapped_column(nullable=True)
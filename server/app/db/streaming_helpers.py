@@ -4,33 +4,42 @@ Streaming-specific database helpers.
 Provides session factory for SSE streaming endpoints.
 """
 
-from collections.abc import Callable, Generator
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.connection import oracle_db
 
 
-def get_session_factory() -> Callable[[], Generator[Session, None, None]]:
+def get_session_factory() -> Callable[[], AbstractAsyncContextManager[AsyncSession]]:
     """
     FastAPI dependency that provides a session factory for streaming functions.
 
     Returns a callable that creates new sessions with context manager support.
     This allows streaming functions to manage their own sessions per iteration.
 
+    Streaming functions only read, so sessions come from the async read-only
+    (AUTOCOMMIT) engine: queries are awaited on the event loop and skip the
+    per-poll COMMIT/ROLLBACK round trips.
+
     Usage in streaming functions:
-        async def my_stream(
-            session_factory=Depends(get_session_factory)
-        ) -> AsyncGenerator[dict[str, str], None]:
+        async def stream_my_data(
+            session_factory: SessionFactory,
+        ) -> AsyncGenerator[ServerSentEvent, None]:
             while True:
-                with session_factory() as session:
-                    result = session.execute(text("SELECT ..."))
-                    yield {...}
+                async with session_factory() as session:
+                    result = await session.execute(text("SELECT ..."))
+                yield sse_event(encode_event_data("my_data", {...}))
                 await asyncio.sleep(1)
 
     Usage in routers:
-        @router.get("/stream/data")
-        async def stream_data(session_factory=Depends(get_session_factory)):
-            return EventSourceResponse(stream_my_data(session_factory))
+        @router.get("/stream/data", response_class=EventSourceResponse)
+        @sse_endpoint
+        async def stream_data(
+            session_factory=Depends(get_session_factory),
+        ) -> AsyncIterator[ServerSentEvent]:
+            async for event in stream_my_data(session_factory):
+                yield event
     """
-    return oracle_db.session_scope
+    return oracle_db.async_read_session_scope
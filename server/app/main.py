@@ -1,8 +1,11 @@
 import logging
+import sys
+
 # Force reload
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.api.routes import include_routers
 from app.core.config import settings
@@ -25,25 +28,45 @@ app = FastAPI(
 # CORS configuration
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins.split(","),
+    allow_origins=settings.cors_origins_list,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Compress JSON bodies. Starlette >= 0.46 never gzips text/event-stream, so SSE
+# frames are not held back to fill a compression window.
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 # Register routers
 include_routers(app)
 
 
 def main():
-    """Entry point for the server"""
+    """
+    Entry point for the server.
+
+    Debug mode runs a single auto-reloading worker; uvicorn rejects reload
+    combined with multiple workers. Otherwise UVICORN_WORKERS processes are
+    started on uvloop + httptools (provided by ``uvicorn[standard]``, uvloop
+    is not available on Windows). The access log and debug-level uvicorn logs
+    are only kept in debug mode.
+    """
     import uvicorn
 
+    workers = 1 if settings.debug else settings.uvicorn_workers
+    native_loop = sys.platform != "win32"
+
     uvicorn.run(
         "app.main:app",
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
+        workers=workers,
+        loop="uvloop" if native_loop else "auto",
+        http="httptools",
+        log_level="debug" if settings.debug else "warning",
+        access_log=settings.debug,
     )
 
 
@@ -23,6 +23,7 @@ from app.schemas.streaming import (
     ErrorData,
     OrderChangeData,
     OrderData,
+    OrderOut,
     OracleTelemetryData,
     RedisData,
     TimestampData,
@@ -36,6 +37,7 @@ __all__ = [
     "ErrorData",
     "OrderChangeData",
     "OrderData",
+    "OrderOut",
     "OracleTelemetryData",
     "RedisData",
     "TimestampData",
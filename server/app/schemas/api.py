@@ -27,19 +27,12 @@ class CreateOrderRequest(BaseModel):
 
 class OracleOrdersStreamRequest(BaseModel):
     """Request body for POST /stream/oracle/orders/changes."""
-    
-    limit: int = Field(50, ge=1, le=500, description="Max orders to track")
-    poll_interval: float = Field(2.0, ge=0.2, le=30.0, description="Poll interval in seconds")
 
-
-class OracleTelemetryStreamRequest(BaseModel):
-    """Request body for POST /stream/oracle/telemetry."""
-    pass
-
-
-class DatabaseStreamRequest(BaseModel):
-    """Request body for POST /stream/database."""
-    pass
+    # strict: JSON numbers only, no str -> number coercion
+    limit: int = Field(50, ge=1, le=500, strict=True, description="Max orders to track")
+    poll_interval: float = Field(
+        2.0, ge=0.2, le=30.0, strict=True, description="Poll interval in seconds"
+    )
 
 
 class UpdateOrderStatusRequest(BaseModel):
@@ -98,8 +91,9 @@ class ChatRequest(BaseModel):
     mode: ChunkMode = Field(
         "token", description="Chunking mode: token, chars, or paragraph"
     )
+    # strict: JSON numbers only, no str -> int coercion
     chunk_size: int = Field(
-        80, ge=1, le=2000, description="Chunk size for chars/paragraph mode"
+        80, ge=1, le=2000, strict=True, description="Chunk size for chars/paragraph mode"
     )
 
 
@@ -5,6 +5,8 @@ This module contains type definitions for various streaming data formats
 used in Server-Sent Events (SSE) responses.
 """
 
+from dataclasses import dataclass
+from datetime import datetime
 from typing import TypedDict
 
 
@@ -70,6 +72,22 @@ class OrderData(TypedDict):
     order_date: str
 
 
+@dataclass(slots=True)
+class OrderOut:
+    """
+    ORDERS row as streamed by the change feed.
+
+    Built positionally from a column-only select; orjson encodes the slotted
+    dataclass and ``order_date`` natively (ISO 8601), with no per-row dict.
+    """
+
+    order_id: int
+    customer_id: int | None
+    status: str
+    salesman_id: int | None
+    order_date: datetime | None
+
+
 class OrderChangeData(TypedDict):
     """Order change event data model."""
 
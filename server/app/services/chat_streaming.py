@@ -1,17 +1,27 @@
 import asyncio
-import json
 import logging
 import time
-from datetime import datetime
-from collections.abc import AsyncGenerator, AsyncIterator
-
-from openai.types.chat import ChatCompletionChunk
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
 
 from app.core.config import settings
+from app.core.sse import ServerSentEvent, encode_event_data, sse_event
 from app.schemas.api import ChunkMode
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+    from openai.types.chat import ChatCompletionChunk
+
 logger = logging.getLogger(__name__)
 
+OPENAI_MAX_RETRIES = 2
+OPENAI_TIMEOUT = 60.0
+OPENAI_CONNECT_TIMEOUT = 5.0
+
+_SENTENCE_END = frozenset(".!?…。！？")
+
 
 class ChatStreamLogger:
     """Context manager for chat stream logging and metrics."""
@@ -30,7 +40,7 @@ class ChatStreamLogger:
         self.error: Exception | None = None
 
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         logger.info(
             "chat_stream [START] req_id=%s client=%s mode=%s chunk_size=%s prompt=[%s]",
             self.req_id,
@@ -42,7 +52,7 @@ class ChatStreamLogger:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = time.time() - self.start_time
+        duration = time.monotonic() - self.start_time
         if exc_type:
             if exc_type is asyncio.CancelledError:
                 logger.info(
@@ -68,7 +78,7 @@ class ChatStreamLogger:
 
     def log_first_token(self):
         if self.first_token_time is None:
-            self.first_token_time = time.time()
+            self.first_token_time = time.monotonic()
             latency = (self.first_token_time - self.start_time) * 1000
             logger.info(
                 "chat_stream [FIRST_TOKEN] req_id=%s latency=%.2fms",
@@ -81,60 +91,216 @@ class ChatStreamLogger:
 
 
 def _is_paragraph_boundary(text: str) -> bool:
-    """Check if text contains paragraph or sentence boundary."""
+    """
+    Check if text contains paragraph or sentence boundary.
+
+    ``_generate_paragraph_chunks`` passes only the last buffered char plus the new
+    delta: the buffered text was already checked when it arrived, so a
+    growing buffer is scanned once overall rather than once per delta.
+    """
     if "\n\n" in text:
         return True
-    stripped = text.rstrip()
-    if not stripped:
-        return False
-    punct = (".", "!", "?", "…", "。", "！", "？")
-    return stripped.endswith(punct) or stripped.endswith("\n")
+    # Last non-whitespace char, found without the rstrip() copy
+    i = len(text) - 1
+    while i >= 0 and text[i].isspace():
+        i -= 1
+    return i >= 0 and text[i] in _SENTENCE_END
+
+
+def _create_event(event_type: str, **kwargs) -> ServerSentEvent:
+    """Create a standardized SSE event."""
+    return sse_event(encode_event_data(event_type, kwargs))
+
+
+@lru_cache(maxsize=1)
+def _get_openai_client() -> "AsyncOpenAI":
+    """
+    Create the process-wide OpenAI client on first use.
+
+    The SDK stays out of app startup, and every chat stream shares one httpx
+    connection pool (HTTP/2 when ``h2`` is installed), so only the first
+    request pays the TLS handshake.
+    """
+    import httpx
+    from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+    return AsyncOpenAI(
+        api_key=settings.openai_api_key,
+        max_retries=OPENAI_MAX_RETRIES,
+        timeout=httpx.Timeout(OPENAI_TIMEOUT, connect=OPENAI_CONNECT_TIMEOUT),
+        http_client=DefaultAsyncHttpxClient(http2=find_spec("h2") is not None),
+    )
+
+
+# Queued by _read_token_deltas after the last delta
+_STREAM_END = object()
+
+
+async def _read_token_deltas(
+    stream: AsyncIterator["ChatCompletionChunk"],
+    queue: asyncio.Queue,
+    monitor: ChatStreamLogger,
+) -> None:
+    """Pump non-empty deltas from the upstream into ``queue``, then an end marker or the error."""
+    first_chunk = True
+    try:
+        async for chunk in stream:
+            if first_chunk:
+                monitor.log_first_token()
+                first_chunk = False
+
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                queue.put_nowait(delta)
+    except Exception as e:
+        queue.put_nowait(e)
+    else:
+        queue.put_nowait(_STREAM_END)
+
+
+async def _generate_token_chunks(
+    stream: AsyncIterator["ChatCompletionChunk"],
+    chunk_size: int,
+    monitor: ChatStreamLogger,
+) -> AsyncIterator[str]:
+    """
+    Yield token deltas, coalescing bursts.
+
+    The first delta is sent as soon as it arrives. Later deltas are batched:
+    the batch is flushed once it holds ``chat_token_batch_size`` deltas or the
+    oldest one has waited ``chat_token_batch_interval`` seconds, also while
+    the upstream stalls, so a fast stream costs one SSE frame per batch
+    instead of one per token.
+
+    One reader task feeds the upstream into a queue. Deltas already queued are
+    drained without suspending; a timed wait is only armed while a batch is
+    pending and the queue is empty.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    reader = asyncio.create_task(_read_token_deltas(stream, queue, monitor))
+    batch: list[str] = []
+    batch_size = settings.chat_token_batch_size
+    batch_interval = settings.chat_token_batch_interval
+    deadline = 0.0
+    first_delta = True
+
+    try:
+        while True:
+            if not queue.empty():
+                item = queue.get_nowait()
+            elif not batch:
+                item = await queue.get()
+            else:
+                try:
+                    item = await asyncio.wait_for(queue.get(), max(deadline - loop.time(), 0.0))
+                except asyncio.TimeoutError:
+                    yield "".join(batch)
+                    batch.clear()
+                    continue
+
+            if item is _STREAM_END:
+                break
+            if isinstance(item, Exception):
+                # Deliver what already arrived before the error event
+                if batch:
+                    yield "".join(batch)
+                    batch.clear()
+                raise item
+
+            if first_delta:
+                first_delta = False
+                yield item
+                continue
+
+            if not batch:
+                deadline = loop.time() + batch_interval
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield "".join(batch)
+                batch.clear()
+    finally:
+        reader.cancel()
+
+    if batch:
+        yield "".join(batch)
+
+
+async def _generate_chars_chunks(
+    stream: AsyncIterator["ChatCompletionChunk"],
+    chunk_size: int,
+    monitor: ChatStreamLogger,
+) -> AsyncIterator[str]:
+    """Yield the stream in chunks of at least ``chunk_size`` chars."""
+    # parts are joined once per flush, not per delta
+    parts: list[str] = []
+    buffered = 0
+
+    first_chunk = True
+    async for chunk in stream:
+        if first_chunk:
+            monitor.log_first_token()
+            first_chunk = False
 
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if not delta:
+            continue
+
+        parts.append(delta)
+        buffered += len(delta)
+        if buffered >= chunk_size:
+            yield "".join(parts)
+            parts.clear()
+            buffered = 0
 
-def _create_event(event_type: str, **kwargs) -> dict[str, str]:
-    """Create a standardized SSE event dictionary."""
-    data = {"type": event_type, "timestamp": datetime.now().isoformat(), **kwargs}
-    return {"event": "message", "data": json.dumps(data)}
+    if parts:
+        yield "".join(parts)
 
 
-async def _generate_chunks(
-    stream: AsyncIterator[ChatCompletionChunk],
-    mode: ChunkMode,
+async def _generate_paragraph_chunks(
+    stream: AsyncIterator["ChatCompletionChunk"],
     chunk_size: int,
     monitor: ChatStreamLogger,
 ) -> AsyncIterator[str]:
-    """Process OpenAI stream and yield cleaned chunks based on mode."""
-    buffer = ""
+    """
+    Yield the stream split at paragraph/sentence boundaries.
+
+    A chunk is also flushed once it reaches
+    ``max(chunk_size, chat_paragraph_flush_threshold)`` chars.
+    """
+    parts: list[str] = []
+    buffered = 0
     flush_threshold = max(chunk_size, settings.chat_paragraph_flush_threshold)
 
+    first_chunk = True
     async for chunk in stream:
-        monitor.log_first_token()
-        
+        if first_chunk:
+            monitor.log_first_token()
+            first_chunk = False
+
         delta = chunk.choices[0].delta.content if chunk.choices else None
         if not delta:
             continue
 
-        if mode == "token":
-            yield delta
-        else:
-            buffer += delta
-            should_flush = False
-            
-            if mode == "chars" and len(buffer) >= chunk_size:
-                should_flush = True
-            elif mode == "paragraph":
-                if _is_paragraph_boundary(buffer) or len(buffer) >= flush_threshold:
-                    should_flush = True
-            
-            if should_flush:
-                yield buffer
-                buffer = ""
-        
-        # Keep loop cooperative
-        await asyncio.sleep(0)
-
-    if buffer:
-        yield buffer
+        # Only the new delta, plus the char before it, can complete a boundary
+        window = parts[-1][-1] + delta if parts else delta
+        parts.append(delta)
+        buffered += len(delta)
+        if _is_paragraph_boundary(window) or buffered >= flush_threshold:
+            yield "".join(parts)
+            parts.clear()
+            buffered = 0
+
+    if parts:
+        yield "".join(parts)
+
+
+# One generator per mode, so the per-delta loop carries no mode checks
+_CHUNK_GENERATORS: dict[ChunkMode, Callable[..., AsyncIterator[str]]] = {
+    "token": _generate_token_chunks,
+    "chars": _generate_chars_chunks,
+    "paragraph": _generate_paragraph_chunks,
+}
 
 
 async def stream_openai_chat(
@@ -143,7 +309,7 @@ async def stream_openai_chat(
     chunk_size: int = 80,
     request_id: str | None = None,
     client_ip: str | None = None,
-) -> AsyncGenerator[dict[str, str], None]:
+) -> AsyncGenerator[ServerSentEvent, None]:
     """Generate streaming chat response from OpenAI."""
     req_id = request_id or "unknown"
 
@@ -151,12 +317,6 @@ async def stream_openai_chat(
         yield _create_event("chat_error", error="OPENAI_API_KEY is not set")
         return
 
-    try:
-        from openai import AsyncOpenAI
-    except ImportError as e:
-        yield _create_event("chat_error", error=f"OpenAI SDK not installed: {e}")
-        return
-
     # Prepare prompt preview
     preview_len = settings.chat_prompt_preview_length
     prompt_preview = (
@@ -167,7 +327,8 @@ async def stream_openai_chat(
 
     with monitor:
         try:
-            client = AsyncOpenAI(api_key=settings.openai_api_key)
+            # Built once per process; later requests reuse its connection pool
+            client = _get_openai_client()
             stream = await client.chat.completions.create(
                 model=settings.openai_model,
                 messages=[
@@ -177,7 +338,7 @@ async def stream_openai_chat(
                 stream=True,
             )
 
-            async for content in _generate_chunks(stream, mode, chunk_size, monitor):
+            async for content in _CHUNK_GENERATORS[mode](stream, chunk_size, monitor):
                 yield _create_event("chat_delta", delta=content)
                 monitor.increment_emitted()
 
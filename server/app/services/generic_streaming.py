@@ -1,15 +1,8 @@
 import asyncio
-import json
 import logging
 from collections.abc import AsyncGenerator, Callable
-from datetime import datetime
 
-from app.schemas.streaming import (
-    CounterData,
-    CustomData,
-    ErrorData,
-    TimestampData,
-)
+from app.core.sse import ServerSentEvent, encode_event_data, event_prefix, event_timestamp, sse_event
 
 logger = logging.getLogger(__name__)
 
@@ -17,69 +10,49 @@ DEFAULT_COUNTER_INTERVAL = 1.0
 RETRY_DELAY = 1.0
 
 
-def _create_event_data(event_type: str, payload: dict) -> dict[str, str]:
-    """Helper to create SSE event data."""
-    return {
-        "event": "message",
-        "data": json.dumps(
-            {
-                "type": event_type,
-                "timestamp": datetime.now().isoformat(),
-                **payload,
-            }
-        ),
-    }
-
-
-def _create_error_response(error: Exception) -> dict[str, str]:
-    """Helper to create error response."""
-    error_data: ErrorData = {
-        "type": "error",
-        "error": str(error),
-        "timestamp": datetime.now().isoformat(),
-    }
-    return {
-        "event": "error",
-        "data": json.dumps(error_data),
-    }
-
-
-def _create_counter_data(count: int) -> dict:
-    """Create counter data."""
-    return {
-        "count": count,
-    }
-
-
-def _create_timestamp_data(count: int) -> dict:
-    """Create timestamp data."""
-    return {
-        "current_time": datetime.now().isoformat(),
-        "message": f"Server time update #{count}",
-    }
-
-
-def _create_custom_data(count: int) -> dict:
-    """Create custom data."""
-    return {
-        "data": f"Custom data #{count}",
-    }
-
-
-DATA_GENERATORS: dict[str, Callable[[int], CounterData | TimestampData | CustomData]] = {
-    "counter": _create_counter_data,
-    "timestamp": _create_timestamp_data,
-    "custom": _create_custom_data,
+def _create_error_response(error: Exception) -> ServerSentEvent:
+    """Helper to create error response (ErrorData fields)."""
+    return sse_event(encode_event_data("error", {"error": str(error)}), event="error")
+
+
+# The payload shapes below are fixed, so each event is formatted straight into
+# its JSON text after the cached type/timestamp head. The interpolated values
+# are ints and encoded timestamps, which need no escaping.
+_COUNTER_HEAD = event_prefix("counter").decode()
+_TIMESTAMP_HEAD = event_prefix("timestamp").decode()
+_CUSTOM_HEAD = event_prefix("custom").decode()
+
+
+def _encode_counter_data(count: int) -> str:
+    """Encode a counter event (CounterData fields)."""
+    return f'{_COUNTER_HEAD}{event_timestamp().decode()},"count":{count}}}'
+
+
+def _encode_timestamp_data(count: int) -> str:
+    """Encode a timestamp event (TimestampData fields); current_time is the event timestamp."""
+    ts = event_timestamp().decode()
+    return f'{_TIMESTAMP_HEAD}{ts},"current_time":{ts},"message":"Server time update #{count}"}}'
+
+
+def _encode_custom_data(count: int) -> str:
+    """Encode a custom event (CustomData fields)."""
+    return f'{_CUSTOM_HEAD}{event_timestamp().decode()},"data":"Custom data #{count}"}}'
+
+
+DATA_GENERATORS: dict[str, Callable[[int], str]] = {
+    "counter": _encode_counter_data,
+    "timestamp": _encode_timestamp_data,
+    "custom": _encode_custom_data,
 }
 
 
 async def stream_data_generator(
     data_type: str = "counter",
     interval: float = DEFAULT_COUNTER_INTERVAL,
-) -> AsyncGenerator[dict[str, str], None]:
+) -> AsyncGenerator[ServerSentEvent, None]:
     """Generic SSE data generator."""
-    generator_func = DATA_GENERATORS.get(data_type)
-    if generator_func is None:
+    encode = DATA_GENERATORS.get(data_type)
+    if encode is None:
         error_msg = f"Unsupported data_type: {data_type}. Available types: {', '.join(DATA_GENERATORS.keys())}"
         logger.error(error_msg)
         yield _create_error_response(ValueError(error_msg))
@@ -90,8 +63,7 @@ async def stream_data_generator(
     try:
         while True:
             try:
-                payload = generator_func(count)
-                yield _create_event_data(data_type, payload)
+                yield sse_event(encode(count))
 
                 count += 1
                 await asyncio.sleep(interval)
@@ -1,16 +1,16 @@
 import asyncio
-import json
 import logging
 import time
 from collections.abc import AsyncGenerator, Callable
-from contextlib import AbstractContextManager
+from contextlib import AbstractAsyncContextManager
 from datetime import datetime
 
-from sqlalchemy import select, text
-from sqlalchemy.orm import Session
+from sqlalchemy import or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.sse import ServerSentEvent, encode_event_data, event_timestamp, sse_event
 from app.db.models import Order
-from app.schemas.streaming import ErrorData
+from app.schemas.streaming import OrderOut
 
 logger = logging.getLogger(__name__)
 
@@ -21,48 +21,42 @@ DEFAULT_HEARTBEAT_INTERVAL = 15.0
 MAX_RETRY_ATTEMPTS = 3
 RETRY_DELAY = 1.0
 
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
 
-def _create_event_data(event_type: str, payload: dict) -> dict[str, str]:
+# Column-only selects skip ORM entity construction and the identity map
+_ORDER_COLUMNS = (
+    Order.order_id,
+    Order.customer_id,
+    Order.status,
+    Order.salesman_id,
+    Order.order_date,
+)
+
+
+def _create_event_data(event_type: str, payload: dict, timestamp: bytes | None = None) -> ServerSentEvent:
     """Helper to create SSE event data."""
-    return {
-        "event": "message",
-        "data": json.dumps(
-            {
-                "type": event_type,
-                "timestamp": datetime.now().isoformat(),
-                **payload,
-            }
-        ),
-    }
-
-
-def _create_error_response(error: Exception) -> dict[str, str]:
-    """Helper to create error response."""
-    error_data: ErrorData = {
-        "type": "error",
-        "error": str(error),
-        "timestamp": datetime.now().isoformat(),
-    }
-    return {
-        "event": "error",
-        "data": json.dumps(error_data),
-    }
-
-
-def _fetch_db_time(session_factory: Callable[[], AbstractContextManager[Session]]) -> datetime | None:
+    return sse_event(encode_event_data(event_type, payload, timestamp))
+
+
+def _create_error_response(error: Exception) -> ServerSentEvent:
+    """Helper to create error response (ErrorData fields)."""
+    return sse_event(encode_event_data("error", {"error": str(error)}), event="error")
+
+
+async def _fetch_db_time(session_factory: SessionFactory) -> datetime | None:
     """Fetch database time."""
-    with session_factory() as session:
-        result = session.execute(text("SELECT SYSDATE FROM DUAL")).fetchone()
+    async with session_factory() as session:
+        result = (await session.execute(text("SELECT SYSDATE FROM DUAL"))).fetchone()
         return result[0] if result else None
 
 
-def _fetch_oracle_telemetry(
-    session_factory: Callable[[], AbstractContextManager[Session]],
+async def _fetch_oracle_telemetry(
+    session_factory: SessionFactory,
 ) -> tuple[str | None, int | None, float]:
     """Fetch Oracle telemetry."""
-    with session_factory() as session:
+    async with session_factory() as session:
         start = time.perf_counter()
-        result = session.execute(
+        result = await session.execute(
             text(
                 """
                 SELECT
@@ -84,60 +78,57 @@ def _fetch_oracle_telemetry(
         return db_time, object_count, elapsed_ms
 
 
-def _fetch_latest_orders(
-    session_factory: Callable[[], AbstractContextManager[Session]], limit: int
-) -> list[dict]:
-    """Fetch latest orders."""
-    with session_factory() as session:
-        stmt = select(Order).order_by(Order.order_id.desc()).limit(limit)
-        orders = session.scalars(stmt).all()
-        return [
-            {
-                "order_id": order.order_id,
-                "customer_id": order.customer_id,
-                "status": order.status,
-                "salesman_id": order.salesman_id,
-                "order_date": order.order_date.isoformat() if order.order_date else None,
-            }
-            for order in orders
-        ]
-
-
-def _fetch_new_orders_since(
-    session_factory: Callable[[], AbstractContextManager[Session]], last_max_id: int
-) -> list[dict]:
-    """Fetch new orders since ID."""
-    with session_factory() as session:
-        stmt = select(Order).where(Order.order_id > last_max_id).order_by(Order.order_id)
-        orders = session.scalars(stmt).all()
-        return [
-            {
-                "order_id": order.order_id,
-                "customer_id": order.customer_id,
-                "status": order.status,
-                "salesman_id": order.salesman_id,
-                "order_date": order.order_date.isoformat() if order.order_date else None,
-            }
-            for order in orders
-        ]
-
-
-def _fetch_initial_order_status(
-    session_factory: Callable[[], AbstractContextManager[Session]], limit: int
+async def _poll_orders(
+    session_factory: SessionFactory, last_max_id: int, limit: int
+) -> tuple[list[OrderOut], list[OrderOut]]:
+    """
+    Fetch one poll tick of ORDERS in a single round trip.
+
+    Selects the union of the next page of new rows (keyset
+    ``order_id > last_max_id``, at most ``limit``; a larger burst is picked up
+    on the following ticks) and the latest ``limit`` rows re-read for
+    status-change detection, then splits it in Python.
+
+    Returns:
+        (new orders ascending by ID, latest orders descending by ID)
+    """
+    new_ids = (
+        select(Order.order_id)
+        .where(Order.order_id > last_max_id)
+        .order_by(Order.order_id)
+        .limit(limit)
+    )
+    latest_ids = select(Order.order_id).order_by(Order.order_id.desc()).limit(limit)
+    stmt = (
+        select(*_ORDER_COLUMNS)
+        .where(or_(Order.order_id.in_(new_ids), Order.order_id.in_(latest_ids)))
+        .order_by(Order.order_id)
+    )
+    async with session_factory() as session:
+        rows = [OrderOut(*row) for row in await session.execute(stmt)]
+
+    # The union holds every one of the latest `limit` IDs, so they are its tail
+    new_orders = [order for order in rows if order.order_id > last_max_id][:limit]
+    latest_orders = rows[:-limit - 1:-1]
+    return new_orders, latest_orders
+
+
+async def _fetch_initial_order_status(
+    session_factory: SessionFactory, limit: int
 ) -> tuple[dict[int, str], int]:
-    """Fetch initial order status snapshot."""
-    orders = _fetch_latest_orders(session_factory, limit)
-    status_map = {}
-    for order in orders:
-        status_map[order["order_id"]] = order["status"]
-    max_id = max(status_map.keys()) if status_map else 0
-    return status_map, max_id
+    """Fetch initial order status snapshot (only the two columns it needs)."""
+    async with session_factory() as session:
+        stmt = select(Order.order_id, Order.status).order_by(Order.order_id.desc()).limit(limit)
+        rows = (await session.execute(stmt)).tuples().all()
+    # Rows come back order_id DESC, so the first one holds the max ID
+    max_id = rows[0][0] if rows else 0
+    return dict(rows), max_id
 
 
 async def stream_database_data(
-    session_factory: Callable[[], AbstractContextManager[Session]],
+    session_factory: SessionFactory,
     poll_interval: float = DEFAULT_DB_POLL_INTERVAL,
-) -> AsyncGenerator[dict[str, str], None]:
+) -> AsyncGenerator[ServerSentEvent, None]:
     """Stream data from Oracle database."""
     count = 0
     retry_count = 0
@@ -145,7 +136,7 @@ async def stream_database_data(
     try:
         while True:
             try:
-                db_time = await asyncio.to_thread(_fetch_db_time, session_factory)
+                db_time = await _fetch_db_time(session_factory)
 
                 yield _create_event_data(
                     "database", {"count": count, "db_time": str(db_time) if db_time else None}
@@ -176,9 +167,9 @@ async def stream_database_data(
 
 
 async def stream_oracle_telemetry_data(
-    session_factory: Callable[[], AbstractContextManager[Session]],
+    session_factory: SessionFactory,
     poll_interval: float = DEFAULT_DB_POLL_INTERVAL,
-) -> AsyncGenerator[dict[str, str], None]:
+) -> AsyncGenerator[ServerSentEvent, None]:
     """Stream telemetry from Oracle."""
     count = 0
     retry_count = 0
@@ -186,9 +177,7 @@ async def stream_oracle_telemetry_data(
     try:
         while True:
             try:
-                db_time, object_count, elapsed_ms = await asyncio.to_thread(
-                    _fetch_oracle_telemetry, session_factory
-                )
+                db_time, object_count, elapsed_ms = await _fetch_oracle_telemetry(session_factory)
 
                 yield _create_event_data(
                     "oracle_telemetry",
@@ -226,23 +215,21 @@ async def stream_oracle_telemetry_data(
 
 
 async def stream_oracle_orders_changes_data(
-    session_factory: Callable[[], AbstractContextManager[Session]],
+    session_factory: SessionFactory,
     limit: int = DEFAULT_ORDERS_LIMIT,
     poll_interval: float = DEFAULT_ORDERS_POLL_INTERVAL,
     heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL,
-) -> AsyncGenerator[dict[str, str], None]:
+) -> AsyncGenerator[ServerSentEvent, None]:
     """Stream change events from ORDERS."""
     prev_status: dict[int, str] = {}
     last_max_id: int = 0
-    last_heartbeat = time.time()
+    last_heartbeat = time.monotonic()
     retry_count = 0
     count = 0
 
     try:
         # 초기 스냅샷
-        prev_status, last_max_id = await asyncio.to_thread(
-            _fetch_initial_order_status, session_factory, limit
-        )
+        prev_status, last_max_id = await _fetch_initial_order_status(session_factory, limit)
 
         yield _create_event_data(
             "oracle_orders_ready",
@@ -251,31 +238,27 @@ async def stream_oracle_orders_changes_data(
 
         while True:
             try:
-                # 1) 신규 주문 조회 및 처리
-                new_orders = await asyncio.to_thread(
-                    _fetch_new_orders_since, session_factory, last_max_id
-                )
+                # 신규 주문 + 최신 주문을 한 번의 쿼리로 조회
+                new_orders, latest_orders = await _poll_orders(session_factory, last_max_id, limit)
+                # 이번 tick에서 발생하는 모든 이벤트가 같은 타임스탬프를 공유
+                tick_ts = event_timestamp()
 
+                # 1) 신규 주문 처리
                 for order in new_orders:
-                    oid = order["order_id"]
+                    oid = order.order_id
                     last_max_id = max(last_max_id, oid)
-                    prev_status[oid] = order["status"]
+                    prev_status[oid] = order.status
                     yield _create_event_data(
                         "oracle_orders_change",
                         {"kind": "new", "order": order, "count": count},
+                        tick_ts,
                     )
                     count += 1
 
                 # 2) 상태 변경 확인
-                latest_orders = await asyncio.to_thread(
-                    _fetch_latest_orders, session_factory, limit
-                )
-                
-                latest_ids = []
                 for order in latest_orders:
-                    oid = order["order_id"]
-                    latest_ids.append(oid)
-                    new_status = order["status"]
+                    oid = order.order_id
+                    new_status = order.status
                     old_status = prev_status.get(oid)
 
                     if old_status is not None and old_status != new_status:
@@ -286,31 +269,34 @@ async def stream_oracle_orders_changes_data(
                                 "kind": "status_changed",
                                 "order": {
                                     "order_id": oid,
-                                    "customer_id": order["customer_id"],
+                                    "customer_id": order.customer_id,
                                     "old_status": old_status,
                                     "new_status": new_status,
-                                    "salesman_id": order["salesman_id"],
-                                    "order_date": order["order_date"],
+                                    "salesman_id": order.salesman_id,
+                                    "order_date": order.order_date,
                                 },
                                 "count": count,
                             },
+                            tick_ts,
                         )
                         count += 1
                     elif old_status is None:
                         # 새로 추적되는 주문 (범위 내 진입)
                         prev_status[oid] = new_status
 
-                # 메모리 관리: 트래킹 목록 최신화
-                keep = set(latest_ids)
-                prev_status = {k: v for k, v in prev_status.items() if k in keep}
+                # 메모리 관리: 트래킹 목록 최신화 (dict 재생성 없이 제자리 삭제)
+                stale = prev_status.keys() - {order.order_id for order in latest_orders}
+                for oid in stale:
+                    del prev_status[oid]
 
                 # 하트비트 전송
-                now = time.time()
+                now = time.monotonic()
                 if now - last_heartbeat >= heartbeat_interval:
                     last_heartbeat = now
                     yield _create_event_data(
                         "oracle_orders_heartbeat",
                         {"tracked": len(prev_status), "last_max_id": last_max_id},
+                        tick_ts,
                     )
 
                 retry_count = 0
@@ -1,12 +1,8 @@
-import uvicorn
-from app.core.config import settings
+from app.main import main
 
 # Version 1.0.1
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "app.main:app",
-        host=settings.host,
-        port=settings.port,
-        reload=True,
-    )
+    # Same configuration as `serve`: UVICORN_WORKERS processes on uvloop +
+    # httptools, or a single auto-reloading worker with DEBUG=true
+    main()
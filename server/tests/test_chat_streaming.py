@@ -0,0 +1,110 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.services.chat_streaming import ChatStreamLogger, _generate_token_chunks
+
+
+def _chunk(content):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+async def _upstream(steps, state):
+    """Fake OpenAI stream: a str is a delta, a float a stall in seconds, None waits forever.
+
+    An exception is raised from the stream.
+    """
+    try:
+        for step in steps:
+            if isinstance(step, str):
+                yield _chunk(step)
+            elif step is None:
+                await asyncio.Event().wait()
+            elif isinstance(step, Exception):
+                raise step
+            else:
+                await asyncio.sleep(step)
+    finally:
+        state["closed"] = True
+
+
+def _token_chunks(steps, state=None):
+    state = {} if state is None else state
+    monitor = ChatStreamLogger("test", None, "token", 1, "")
+    return _generate_token_chunks(_upstream(steps, state), 1, monitor)
+
+
+async def _collect(chunks):
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    return [(loop.time() - start, text) async for text in chunks]
+
+
+@pytest.fixture
+def batching(monkeypatch):
+    def configure(size, interval):
+        monkeypatch.setattr(settings, "chat_token_batch_size", size)
+        monkeypatch.setattr(settings, "chat_token_batch_interval", interval)
+
+    return configure
+
+
+def test_first_delta_sent_at_once(batching):
+    batching(16, 10.0)
+    events = asyncio.run(_collect(_token_chunks(["Hel", 0.3, "lo"])))
+
+    assert [text for _, text in events] == ["Hel", "lo"]
+    assert events[0][0] < 0.1
+
+
+def test_flush_at_batch_size(batching):
+    batching(4, 10.0)
+    events = asyncio.run(_collect(_token_chunks(["a"] + ["b"] * 8 + [0.3])))
+
+    assert [text for _, text in events] == ["a", "bbbb", "bbbb"]
+    assert events[-1][0] < 0.1
+
+
+def test_timer_flush_during_stall(batching):
+    batching(16, 0.02)
+    events = asyncio.run(_collect(_token_chunks(["Hel", "lo", 0.5, " world"])))
+
+    assert [text for _, text in events] == ["Hel", "lo", " world"]
+    assert events[1][0] < 0.3
+    assert events[2][0] >= 0.5
+
+
+def test_cancel_with_pending_batch_stops_reader(batching):
+    batching(16, 10.0)
+
+    async def run():
+        state = {}
+        chunks = _token_chunks(["a", "b", None], state)
+        assert await anext(chunks) == "a"
+
+        pending = asyncio.create_task(anext(chunks))
+        await asyncio.sleep(0.05)
+        pending.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await pending
+        await asyncio.sleep(0)
+
+        assert state.get("closed")
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    asyncio.run(run())
+
+
+def test_upstream_error_flushes_pending_batch(batching):
+    batching(16, 10.0)
+
+    async def run():
+        received = []
+        with pytest.raises(RuntimeError, match="upstream"):
+            async for text in _token_chunks(["Hel", "lo", " wor", RuntimeError("upstream")]):
+                received.append(text)
+        return received
+
+    assert asyncio.run(run()) == ["Hel", "lo wor"]